@@ -25,7 +25,6 @@ Future tasks:
 - Provide a full info print function
 
 - Create private or protected members so that things don't get changed carelessly.
-- Consider the time complexity of convert() being O(2n) right now, which could be improved to (n). This could be alleviated, by creating a dictionary of a dictionary for unitDict, and using hash look-ups (as opposed to linear search look ups)
 - Improve the formula description, so that formulas can more easily be back-tracked. This will require using parenthesis, and doing some clean-up after a certain set of operations has been completed.
 - When adding, subtracting, multiplying, dividing, provide a feature that is "smartly" selects the unit, instead of always converting everything to the base unit. For example, this could be achieved by recording what units were used initially, and then conducting some sort of similarity search.
 - When creating the tmpName and formula, consider providing paranethesis logic in case mult/div gets combined with add/sub
@@ -37,77 +36,242 @@ Look into this class further.
 """
 
 # Modules
-import copy
+import functools
+import numbers
+import operator
 import re
+import sys
+import typing
+
+
+# Row format of unitDict
+class UnitSet(typing.NamedTuple):
+    units: tuple  # Supported units
+    factors: tuple  # Conversion factors relative to the "Norm" unit
+    base: str  # "Norm" unit
+    siid: tuple  # SI composition
+
 
 """
 #Global variables
 #-----------------------------------------------------------------------#
 Define all the unitSets (length, area, force, etc.) and the associated linked units
 - this is a highly controlled data-structure, do not change the order carelessly
-- Each value entry is a list of the following format:
---- [list of supported units,
+- Each value entry is a UnitSet of the following format:
+--- UnitSet(tuple of supported units,
 	 conversion factor relative to "Norm" unit,
-	 "Norm" unit, SI composition list in [length {L}, mass {M}, time {T}, temperature {H}, electric current {E}, amount of substance {A}, luminous intensity {I}]
-	]
+	 "Norm" unit, SI composition tuple in [length {L}, mass {M}, time {T}, temperature {H}, electric current {E}, amount of substance {A}, luminous intensity {I}]
+	)
 - unitSets must have mutually exclusive units
 """
 unitDict = {
-    "unitless": [[""], [], "", [0, 0, 0, 0, 0, 0, 0]],
-    "length": [
-        ["μm", "mm", "cm", "dm", "m", "km"],
-        [1e6, 1e3, 1e2, 1e1, 1, 1e-3],
+    "unitless": UnitSet(("",), (), "", (0, 0, 0, 0, 0, 0, 0)),
+    "length": UnitSet(
+        ("μm", "mm", "cm", "dm", "m", "km"),
+        (1e6, 1e3, 1e2, 1e1, 1, 1e-3),
         "m",
-        [1, 0, 0, 0, 0, 0, 0],
-    ],
-    "area": [
-        ["μm2", "mm2", "cm2", "dm2", "m2", "km2"],
-        [1e12, 1e6, 1e4, 1e2, 1, 1e-6],
+        (1, 0, 0, 0, 0, 0, 0),
+    ),
+    "area": UnitSet(
+        ("μm2", "mm2", "cm2", "dm2", "m2", "km2"),
+        (1e12, 1e6, 1e4, 1e2, 1, 1e-6),
         "m2",
-        [2, 0, 0, 0, 0, 0, 0],
-    ],
-    "section mod.|volume": [
-        ["μm3", "mm3", "cm3", "dm3", "m3", "km3"],
-        [1e18, 1e9, 1e6, 1e3, 1, 1e-9],
+        (2, 0, 0, 0, 0, 0, 0),
+    ),
+    "section mod.|volume": UnitSet(
+        ("μm3", "mm3", "cm3", "dm3", "m3", "km3"),
+        (1e18, 1e9, 1e6, 1e3, 1, 1e-9),
         "m3",
-        [3, 0, 0, 0, 0, 0, 0],
-    ],
-    "mom. of inert.|tors. const.": [
-        ["μm4", "mm4", "cm4", "dm4", "m4", "km4"],
-        [1e24, 1e12, 1e8, 1e4, 1, 1e-12],
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "mom. of inert.|tors. const.": UnitSet(
+        ("μm4", "mm4", "cm4", "dm4", "m4", "km4"),
+        (1e24, 1e12, 1e8, 1e4, 1, 1e-12),
         "m4",
-        [4, 0, 0, 0, 0, 0, 0],
-    ],
-    "wraping constant": [
-        ["μm6", "mm6", "cm6", "dm6", "m6", "km6"],
-        [1e36, 1e18, 1e12, 1e6, 1, 1e-18],
+        (4, 0, 0, 0, 0, 0, 0),
+    ),
+    "wraping constant": UnitSet(
+        ("μm6", "mm6", "cm6", "dm6", "m6", "km6"),
+        (1e36, 1e18, 1e12, 1e6, 1, 1e-18),
         "m6",
-        [6, 0, 0, 0, 0, 0, 0],
-    ],
-    "mass": [["g", "kg"], [1e3, 1], "kg", [0, 1, 0, 0, 0, 0, 0]],
-    "time": [["μs", "ms", "s", "ks"], [1e6, 1e3, 1, 1e-3], "s", [0, 0, 1, 0, 0, 0, 0]],
-    "force": [["N", "kN", "MN"], [1, 1e-3, 1e-6], "N", [1, 1, -2, 0, 0, 0, 0]],
-    "moment": [["Nm", "kNm", "MNm"], [1, 1e-3, 1e-6], "Nm", [2, 1, -2, 0, 0, 0, 0]],
-    "stress|strain": [
-        ["Pa", "kPa", "MPa", "N/mm2"],
-        [1, 1e-3, 1e-6, 1e-6],
+        (6, 0, 0, 0, 0, 0, 0),
+    ),
+    "mass": UnitSet(("g", "kg"), (1e3, 1), "kg", (0, 1, 0, 0, 0, 0, 0)),
+    "time": UnitSet(
+        ("μs", "ms", "s", "ks"), (1e6, 1e3, 1, 1e-3), "s", (0, 0, 1, 0, 0, 0, 0)
+    ),
+    "force": UnitSet(("N", "kN", "MN"), (1, 1e-3, 1e-6), "N", (1, 1, -2, 0, 0, 0, 0)),
+    "moment": UnitSet(
+        ("Nm", "kNm", "MNm"), (1, 1e-3, 1e-6), "Nm", (2, 1, -2, 0, 0, 0, 0)
+    ),
+    "stress|strain": UnitSet(
+        ("Pa", "kPa", "MPa", "N/mm2"),
+        (1, 1e-3, 1e-6, 1e-6),
         "Pa",
-        [-1, 1, -2, 0, 0, 0, 0],
-    ],
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
 }
-precLevel = 15  # Level of precision for mult/div operations
+precLevel = 15  # Level of precision for rounding (None disables rounding)
+# First non-numeric character, i.e. start of the unit
+_VALUE_UNIT_RE = re.compile(r"[^0-9.]")
+
+# SI units, in the order of the SIID
+_SI_UNITS = ("m", "kg", "s", "K", "A", "mole", "cd")
+
+# SIIDs are also packed into a single integer, with one biased 16-bit lane per SI unit.
+# Powers are limited so that adding/subtracting two packed SIIDs never carries accross lanes.
+_SIID_LANE_BITS = 16
+_SIID_LANE_OFFSET = 1 << 15
+_SIID_LANE_LIMIT = 1 << 14
+_SIID_BIAS = sum(
+    _SIID_LANE_OFFSET << (_SIID_LANE_BITS * i) for i in range(len(_SI_UNITS))
+)  # Packed SIID of a dimensionless value
+
+
+# Pack an SIID into an integer, or return None if it contains non-integer (or too large) powers
+@functools.lru_cache(maxsize=1024)
+def _packSIID(SIID):
+    packed = 0
+    for i, power in enumerate(SIID):
+        if not -_SIID_LANE_LIMIT <= power < _SIID_LANE_LIMIT or power != int(power):
+            return None
+        packed |= (int(power) + _SIID_LANE_OFFSET) << (_SIID_LANE_BITS * i)
+    return packed
+
+
+# Convert integer-valued powers of an SIID to int, e.g. (2.0, 0.5, ...) -> (2, 0.5, ...)
+def _intSIID(SIID):
+    return tuple(
+        int(power) if isinstance(power, float) and power.is_integer() else power
+        for power in SIID
+    )
+
+
+# Establish the unit from a (normalised) SIID. Cached, as the same SIIDs recur often
+@functools.lru_cache(maxsize=1024)
+def _unitFromSIID(SIID):
+    # Join each non-dimensionless unit, adding its power unless it is 1
+    return " ".join(
+        unit if power == 1 else f"{unit}{power}"
+        for unit, power in zip(_SI_UNITS, SIID)
+        if power != 0
+    )
+
+
+# Check whether two variables have the same SIID, comparing packed SIIDs where possible
+def _sameSIID(firstVar, secondVar):
+    if firstVar._SIIDPacked is not None:
+        return firstVar._SIIDPacked == secondVar._SIIDPacked
+    return firstVar._SIID == secondVar._SIID
+
+
+# Reverse look-up tables, built once from unitDict for O(1) unitSet retrieval
+_UNIT_TO_SET = {}  # unit name -> unitSet
+_SIID_TO_SET = {}  # packed SIID -> unitSet
+_SET_TO_PACKED = {}  # unitSet -> packed SIID
+for setName, unitSet in unitDict.items():
+    # Intern unit names, so that look-ups on them reduce to identity checks
+    unitSet = unitDict[setName] = unitSet._replace(
+        units=tuple(sys.intern(u) for u in unitSet.units),
+        base=sys.intern(unitSet.base),
+    )
+    for u in unitSet.units:
+        _UNIT_TO_SET[u] = setName
+    _SET_TO_PACKED[setName] = _packSIID(unitSet.siid)
+    _SIID_TO_SET[_SET_TO_PACKED[setName]] = setName
+
+# Conversion factors, pre-divided so that _FACTOR[fromUnit][toUnit] converts directly
+_FACTOR = {}
+for unitSet in unitDict.values():
+    for fromUnit, fromFactor in zip(unitSet.units, unitSet.factors):
+        for toUnit, toFactor in zip(unitSet.units, unitSet.factors):
+            _FACTOR.setdefault(fromUnit, {})[toUnit] = toFactor / fromFactor
 # -----------------------------------------------------------------------#
 
 
+# Change the precision level used for rounding; None disables rounding altogether
+def setPrecision(level):
+    global precLevel
+    if level is not None and (not isinstance(level, int) or isinstance(level, bool)):
+        raise Exception("precision level must be an integer or None.")
+    precLevel = level
+
+
+# Round a value to the precision level. Arithmetic is conducted unrounded; rounding is only applied on output and comparisons
+def _roundPrec(value):
+    if precLevel is None:
+        return value
+    return round(value, precLevel)
+
+
+# Element-wise arithmetic on arrays of base values, by operation name and numpy fallback ufunc
+_BASE_UFUNCS = {"add": "add", "mul": "multiply", "pow": "power"}
+# numba kernels, compiled on the first jittedOp() call ({} without numba)
+_BASE_KERNELS = None
+
+
+# Compile the element-wise kernels with numba. Done lazily, as importing numba is slow
+def _baseKernels():
+    global _BASE_KERNELS
+    if _BASE_KERNELS is not None:
+        return _BASE_KERNELS
+
+    try:
+        import numba
+    except ImportError:  # numba is optional, jittedOp() then falls back to numpy
+        _BASE_KERNELS = {}
+        return _BASE_KERNELS
+
+    @numba.njit(parallel=True)
+    def addBase(a, b, out):
+        for i in numba.prange(a.shape[0]):
+            out[i] = a[i] + b[i]
+
+    @numba.njit(parallel=True)
+    def mulBase(a, b, out):
+        for i in numba.prange(a.shape[0]):
+            out[i] = a[i] * b[i]
+
+    @numba.njit(parallel=True)
+    def powBase(a, b, out):
+        for i in numba.prange(a.shape[0]):
+            out[i] = a[i] ** b[i]
+
+    _BASE_KERNELS = {"add": addBase, "mul": mulBase, "pow": powBase}
+    return _BASE_KERNELS
+
+
 # Physical variable class - made to deal with physical measurements
 class pyunits:
+    # Fixed set of attributes, avoids a per-instance __dict__
+    __slots__ = (
+        "name",
+        "value",
+        "unit",
+        "_SIID",
+        "_SIIDPacked",
+        "info",
+        "formula",
+        "unitSet",
+        "unitBase",
+        "valueBase",
+    )
+
     # --- Class constructor
     def __init__(self, name, value=None, unit=None, SIID=None, info=None, formula=None):
         # pytCheck input is sufficient
         if name != None and value != None and unit != None:
             self.name = name  # Variable name
-            self.value = round(value, precLevel)  # Variable value
-            self.unit = unit  # Variable unit
+            # Check the value is a real number (e.g. Decimal), with a fast path for int and float
+            if type(value) is not int and type(value) is not float:
+                if not isinstance(value, numbers.Number) or (
+                    isinstance(value, numbers.Complex)
+                    and not isinstance(value, numbers.Real)
+                ):
+                    raise Exception("pyunits() value must be a number.")
+            self.value = value  # Variable value
+            # Variable unit, interned if valid (otherwise rejected by findUnitSet below)
+            self.unit = sys.intern(unit) if isinstance(unit, str) else unit
 
         elif value == None and unit == None:
             # Check if name string contains input variables
@@ -124,18 +288,18 @@ class pyunits:
                 )
             else:  # Continue to extract pyunits
                 self.name = nameSplit[0]  # Retrieve the name
-                tmpOut = re.search(
-                    r"[^0-9|^.]", nameSplit[1]
+                tmpOut = _VALUE_UNIT_RE.search(
+                    nameSplit[1]
                 )  # Evaluate position of first unit character
                 value, unit = (
                     nameSplit[1][: tmpOut.start()],
                     nameSplit[1][tmpOut.start() :],
                 )  # Split the string at that location
                 if "." in value:  # If the value is a decimal, convert to float
-                    self.value = round(float(value), precLevel)  # Variable value
+                    self.value = float(value)  # Variable value
                 else:  # Otherwise, convert to an integer
                     self.value = int(value)
-                self.unit = unit  # Variable unit
+                self.unit = sys.intern(unit)  # Variable unit
         elif (value == None and unit != None) or (value != None and unit == None):
             raise Exception(
                 "missing input, need to specify variable name, value and unit. Ex: pyunits('a=10m') or pyunits('a', '10', 'm'))."
@@ -144,7 +308,6 @@ class pyunits:
             raise Exception("input to pyunits() not valid.")
 
         # Assign other class variables
-        self.SIID = SIID  # SI units IDdentifier
         self.info = info  # Description of variable
         self.formula = formula  # Formula of variable if available
 
@@ -155,58 +318,134 @@ class pyunits:
         # If list is 0 length, then an unknown unitSet was created (can occur due to multiplication/division of variables).
         if len(lstUnitSet) == 0:  # Unknown unitSet
             # Check that SIID is provided, otherwise raise an exception
-            if self.SIID == None:
+            if SIID == None:
                 raise Exception(
                     "unknown units, SIID must be specified within pyunits call."
                 )
+            self.SIID = SIID  # SI units IDdentifier, packed by the property setter
             # Assume that if a non-unitSet variable is used, all units are in their "base" form already
             self.unitBase = self.unit
-            self.valueBase = round(self.value, precLevel)
+            self.valueBase = self.value
         else:  # List has length 1, which contains the unitSet
             self.unitSet = lstUnitSet[0]  # Assign the unitSet
-            self.SIID = unitDict[self.unitSet][3]  # Assign SIID
-            self.unitBase = unitDict[self.unitSet][2]  # Assign base unit
+            self._SIID = unitDict[self.unitSet].siid  # Assign SIID
+            self._SIIDPacked = _SET_TO_PACKED[self.unitSet]  # Assign packed SIID
+            self.unitBase = unitDict[self.unitSet].base  # Assign base unit
             # --- Convert and save value in baseUnits
             if self.unitBase == self.unit:
                 self.valueBase = self.value
             else:
-                self.valueBase = round(
-                    self.convert(self.unitBase, out="value"), precLevel
+                self.valueBase = self.convert(self.unitBase, out="value")
+
+    # --- SI units IDentifier, kept in sync with its packed form (used for fast comparisons)
+    @property
+    def SIID(self):
+        return self._SIID
+
+    @SIID.setter
+    def SIID(self, SIID):
+        self._SIID = None if SIID is None else tuple(SIID)
+        self._SIIDPacked = None if SIID is None else _packSIID(self._SIID)
+
+    # --- Shallow clone, all attributes are immutable so no deepcopy is required
+    def _clone(self):
+        newpyunits = object.__new__(pyunits)
+        newpyunits.name = self.name
+        newpyunits.value = self.value
+        newpyunits.unit = self.unit
+        newpyunits._SIID = self._SIID
+        newpyunits._SIIDPacked = self._SIIDPacked
+        newpyunits.info = self.info
+        newpyunits.formula = self.formula
+        newpyunits.unitSet = self.unitSet
+        newpyunits.unitBase = self.unitBase
+        newpyunits.valueBase = self.valueBase
+        return newpyunits
+
+    # --- Fast factory for arithmetic results, whose value is already known in base units
+    @classmethod
+    def _fromBase(cls, name, valueBase, unitBase, SIID, SIIDPacked, unitSet, formula):
+        newpyunits = object.__new__(cls)
+        newpyunits.name = name
+        newpyunits.value = valueBase
+        newpyunits.unit = unitBase
+        newpyunits._SIID = SIID
+        newpyunits._SIIDPacked = SIIDPacked
+        newpyunits.info = None
+        newpyunits.formula = formula
+        newpyunits.unitSet = unitSet
+        newpyunits.unitBase = unitBase
+        newpyunits.valueBase = valueBase
+        return newpyunits
+
+    # --- Combine the SIIDs of a multiplication (sign=1) or division (sign=-1), returning (SIID, packed SIID, unitSet, unit)
+    def _combineSIID(self, other, sign):
+        # Combine directly in packed form if possible, only unpacking when required
+        if self._SIIDPacked is not None and other._SIIDPacked is not None:
+            newSIIDPacked = self._SIIDPacked + sign * (other._SIIDPacked - _SIID_BIAS)
+            tmpUnitSet = _SIID_TO_SET.get(newSIIDPacked)
+            if tmpUnitSet is not None:  # the unitSet exists
+                return (
+                    unitDict[tmpUnitSet].siid,
+                    newSIIDPacked,
+                    tmpUnitSet,
+                    unitDict[tmpUnitSet].base,
                 )
 
+            # Otherwise the unitSet does not exist. Integer SIIDs, hence the combined tuple needs no
+            # normalisation; it is re-packed from the tuple to enforce the lane limits
+            newSIID = tuple(
+                map(operator.add if sign > 0 else operator.sub, self._SIID, other._SIID)
+            )
+            return newSIID, _packSIID(newSIID), None, _unitFromSIID(newSIID)
+
+        # Non-integer SIIDs cannot be packed, combine and normalise their tuples instead
+        newSIID = _intSIID(a + sign * b for a, b in zip(self._SIID, other._SIID))
+        newSIIDPacked = _packSIID(newSIID)
+        tmpUnitSet = _SIID_TO_SET.get(newSIIDPacked)
+        if tmpUnitSet is None:  # unitSet does not exist
+            return newSIID, newSIIDPacked, None, _unitFromSIID(newSIID)
+        return (
+            unitDict[tmpUnitSet].siid,
+            newSIIDPacked,
+            tmpUnitSet,
+            unitDict[tmpUnitSet].base,
+        )
+
     # --- A dunder method to change what is shown with print()
     def __repr__(self):
         rString = (
             "pyunits('{}', value={}, unit='{}', SIID={}, info={}, formula={})".format(
-                self.name, self.value, self.unit, self.SIID, self.info, self.formula
+                self.name,
+                _roundPrec(self.value),
+                self.unit,
+                self.SIID,
+                self.info,
+                self.formula,
             )
         )
         return rString
 
     def __str__(self):
-        return "{} = {}{}".format(self.name, self.value, self.unit)
+        return "{} = {}{}".format(self.name, _roundPrec(self.value), self.unit)
 
     # --- Addition magic  method for arithmetics
     def __add__(self, other):
         # If "other" is not pyunits, then treat the "other" value as a number of the same units. Hence, simply update the values
         if not isinstance(other, pyunits):
-            newpyunits = copy.deepcopy(self)  # Required to return a new variable
+            newpyunits = self._clone()  # Required to return a new variable
             # Update value and base values
-            newpyunits.value = round(self.value + other, precLevel)
+            newpyunits.value = self.value + other
             if newpyunits.unitBase == self.unit:
-                newpyunits.valueBase = round(self.valueBase + other, precLevel)
+                newpyunits.valueBase = self.valueBase + other
             else:
-                newpyunits.valueBase = round(
-                    self.valueBase
-                    + pyunits("tmp", other, self.unit).convert(
-                        self.unitBase, out="value"
-                    ),
-                    precLevel,
+                newpyunits.valueBase = (
+                    self.valueBase + other * _FACTOR[self.unit][self.unitBase]
                 )
             return newpyunits  # Return the object itself
 
         # If adding accross different unit sets, raise exception (bc it is non-phyisical to add different unitSets together).
-        if self.SIID != other.SIID:
+        if not _sameSIID(self, other):
             raise Exception(
                 "cannot add/subtract values from different unitSets. Unit sets in question: {} and {} | SIID: {} and {}.".format(
                     self.unitSet, other.unitSet, self.SIID, other.SIID
@@ -215,90 +454,70 @@ class pyunits:
 
         # Otherwise, perform addition operation
         tmpName = self.name + "+" + other.name  # Create a new name
-        # Check if the unitSet exists within unitDict
-        lstUnitSet = pyunits.findUnitSet(self.unit)
-        if len(lstUnitSet) == 0:  # unit does not exist within unitSets
-            return pyunits(
-                tmpName,
-                round(self.valueBase + other.valueBase, precLevel),
-                self.unitBase,
-                SIID=self.SIID,
-                formula=tmpName,
-            )  # Return new pyunits
-        else:  # List has length 1, meaning unitSet exists
-            return pyunits(
-                tmpName,
-                round(self.valueBase + other.valueBase, precLevel),
-                self.unitBase,
-                formula=tmpName,
-            )  # Return new pyunits
+        # Both variables share the same SIID, hence also the same unitSet and unitBase
+        return pyunits._fromBase(
+            tmpName,
+            self.valueBase + other.valueBase,
+            self.unitBase,
+            self._SIID,
+            self._SIIDPacked,
+            self.unitSet,
+            tmpName,
+        )  # Return new pyunits
 
     # --- Subtraction magic, method for arithmetics
-    def __sub__(self, other):  # Does negated addition
+    def __sub__(self, other):
         # If "other" is not a pyunits (assuming it is a number)
         if not isinstance(other, pyunits):
             return self.__add__(-other)
 
-        # If it is a pyunits, make the appropriate changes to the "other" pyunits, and then perform addition of it's negative value
-        else:
-            # Required in order not make references changes to variable "other"
-            other = copy.deepcopy(other)
-
-            # Then conduct operation
-            other.value *= -1
-            other.valueBase *= -1  # Negate values
-            newpyunits = self.__add__(other)  # Conduct negative addition
+        # If subtracting accross different unit sets, raise exception (bc it is non-phyisical to subtract different unitSets).
+        if not _sameSIID(self, other):
+            raise Exception(
+                "cannot add/subtract values from different unitSets. Unit sets in question: {} and {} | SIID: {} and {}.".format(
+                    self.unitSet, other.unitSet, self.SIID, other.SIID
+                )
+            )
 
-            # Update the name and formula to reflect true operation
-            tmpName = self.name + "-" + other.name
-            newpyunits.name = tmpName
-            newpyunits.formula = tmpName
-            return newpyunits  # Return physical variable
+        # Otherwise, perform subtraction operation
+        tmpName = self.name + "-" + other.name  # Create a new name
+        return pyunits._fromBase(
+            tmpName,
+            self.valueBase - other.valueBase,
+            self.unitBase,
+            self._SIID,
+            self._SIIDPacked,
+            self.unitSet,
+            tmpName,
+        )  # Return new pyunits
 
     # --- Multiplication magic, method for arithmetics
     def __mul__(self, other):
         # If "other" is not pyunits, then assume "other" is a number to manipulate the "self" variable. Update both value and baseValue
         if not isinstance(other, pyunits):
-            newpyunits = copy.deepcopy(self)  # Required in order not to change self
-            newpyunits.value = round(self.value * other, precLevel)  # Update the value
-            newpyunits.valueBase = round(
-                self.valueBase * other, precLevel
+            newpyunits = self._clone()  # Required in order not to change self
+            newpyunits.value = self.value * other  # Update the value
+            newpyunits.valueBase = (
+                self.valueBase * other
             )  # Update the SI value (no conversion needed)
             return newpyunits  # Return the object itself
 
         # Otherwise perform multiplication operation
         tmpName = self.name + "*" + other.name  # Create a new name
 
-        # Identify the new SIID
-        newSIID = [sum(i) for i in zip(self.SIID, other.SIID)]
-
-        # Check if the unitSet exists within unitDict
-        lstUnitSet = pyunits.findUnitSet(newSIID)
-        if len(lstUnitSet) == 0:  # unitSet does not exist
-            tmpUnit = pyunits.findUnitFromSIID(
-                newSIID
-            )  # Find the correct unit from SIID
-
-            # Conduct operation
-            return pyunits(
-                tmpName,
-                round(self.valueBase * other.valueBase, precLevel),
-                tmpUnit,
-                SIID=newSIID,
-                formula=tmpName,
-            )
-
-        # Only other option is that len(lstUnitSet) == 1, the unitSet exists
-        else:
-            tmpUnit = unitDict[lstUnitSet[0]][2]  # Assign unit name
-
-            # Conduct operation
-            return pyunits(
-                tmpName,
-                round(self.valueBase * other.valueBase, precLevel),
-                tmpUnit,
-                formula=tmpName,
-            )
+        # Identify the new SIID and whether it belongs to a unitSet
+        newSIID, newSIIDPacked, tmpUnitSet, tmpUnit = self._combineSIID(other, 1)
+
+        # Conduct operation
+        return pyunits._fromBase(
+            tmpName,
+            self.valueBase * other.valueBase,
+            tmpUnit,
+            newSIID,
+            newSIIDPacked,
+            tmpUnitSet,
+            tmpName,
+        )
 
     # --- Division magic, method for arithmetics
     def __truediv__(self, other):
@@ -306,22 +525,22 @@ class pyunits:
         if not isinstance(other, pyunits):
             return self.__mul__(1 / other)
 
-        # If it is a pyunits, make the appropriate changes to the "other" pyunits
-        else:
-            # Deepcopy required to make changes to "other" variable
-            other = copy.deepcopy(other)
-
-            # Then conduct operation
-            other.value = 1 / other.value
-            other.valueBase = 1 / other.valueBase  # Invert values
-            other.SIID = [i * -1 for i in other.SIID]
-            newpyunits = self.__mul__(other)  # Conduct inverted multiplication
-
-            # Update the name and formula to reflect true operation
-            tmpName = self.name + "/" + other.name
-            newpyunits.name = tmpName
-            newpyunits.formula = tmpName
-            return newpyunits  # Return physical variable
+        # Otherwise perform division operation
+        tmpName = self.name + "/" + other.name  # Create a new name
+
+        # Identify the new SIID and whether it belongs to a unitSet
+        newSIID, newSIIDPacked, tmpUnitSet, tmpUnit = self._combineSIID(other, -1)
+
+        # Conduct operation
+        return pyunits._fromBase(
+            tmpName,
+            self.valueBase / other.valueBase,
+            tmpUnit,
+            newSIID,
+            newSIIDPacked,
+            tmpUnitSet,
+            tmpName,
+        )
 
     # --- Power magic, method for arithmetics
     def __pow__(self, other, mod=None):
@@ -330,22 +549,34 @@ class pyunits:
             raise Exception("exponent must be an integer or float.")
 
         # Calculate the correct value
-        tmpValueBase = round(self.valueBase**other, precLevel)  # Use base
+        tmpValueBase = self.valueBase**other  # Use base
 
-        # Adjust the SIID based on the power
-        tmpSIID = [round(i * other, precLevel) for i in self.SIID]
+        # Adjust the SIID based on the power (normalised once here, for the cached unit look-up)
+        # Integer powers of integer SIIDs stay integer
+        if type(other) == int and self._SIIDPacked is not None:
+            tmpSIID = tuple(i * other for i in self._SIID)
+        else:
+            tmpSIID = _intSIID(_roundPrec(i * other) for i in self._SIID)
+        tmpSIIDPacked = _packSIID(tmpSIID)
 
         # Check if the unitSet exists within unitDict
-        lstUnitSet = pyunits.findUnitSet(tmpSIID)
-        if len(lstUnitSet) == 0:  # unitSet does not exist
-            tmpUnitBase = pyunits.findUnitFromSIID(tmpSIID)  # Find the correct unit
-        else:  # Only other option is that len(lstUnitSet) == 1, the unitSet exists
-            tmpUnitBase = unitDict[lstUnitSet[0]][2]  # Assign unit name
+        tmpUnitSet = _SIID_TO_SET.get(tmpSIIDPacked)
+        if tmpUnitSet is None:  # unitSet does not exist
+            tmpUnitBase = _unitFromSIID(tmpSIID)  # Find the correct unit
+        else:  # Otherwise, the unitSet exists
+            tmpUnitBase = unitDict[tmpUnitSet].base  # Assign unit name
+            tmpSIID = unitDict[tmpUnitSet].siid  # Assign SIID
 
         tmpName = self.name + "^" + str(other)  # Create a new name
 
-        return pyunits(
-            tmpName, tmpValueBase, tmpUnitBase, SIID=tmpSIID, formula=tmpName
+        return pyunits._fromBase(
+            tmpName,
+            tmpValueBase,
+            tmpUnitBase,
+            tmpSIID,
+            tmpSIIDPacked,
+            tmpUnitSet,
+            tmpName,
         )
 
     # --- For reverse addition, subtraction, multiplication and division
@@ -360,13 +591,21 @@ class pyunits:
 
     def __rtruediv__(self, other):  # Needs adjustment b/c division is not commutative
         # Invert values and SIID of self
-        newSelf = copy.deepcopy(self)  # Deepcopy dissociated from self
+        newSelf = self._clone()  # Clone dissociated from self
         newSelf.value = 1 / newSelf.value
         newSelf.valueBase = 1 / newSelf.valueBase
-        newSelf.SIID = [i * -1 for i in newSelf.SIID]
-
-        # Convert other into pyunits (otherwise SIID is not updated)
-        other = pyunits(str(other), other, "")
+        newSelf.SIID = tuple(-i for i in newSelf.SIID)
+
+        # Convert other into a unitless pyunits (otherwise SIID is not updated)
+        other = pyunits._fromBase(
+            str(other),
+            other,
+            "",
+            unitDict["unitless"].siid,
+            _SIID_BIAS,
+            "unitless",
+            None,
+        )
         newpyunits = newSelf.__mul__(other)  # Conduct inverted multiplication
 
         # Update the name and formula to reflect true operation
@@ -377,14 +616,14 @@ class pyunits:
 
     # --- Unary arithemtic, negative
     def __neg__(self):
-        newpyunits = copy.deepcopy(self)
+        newpyunits = self._clone()
         newpyunits.value *= -1
         newpyunits.valueBase *= -1
         return newpyunits
 
     # --- Unary arithemtic, absolute
     def __abs__(self):
-        newpyunits = copy.deepcopy(self)
+        newpyunits = self._clone()
         newpyunits.value = abs(newpyunits.value)
         newpyunits.valueBase = abs(newpyunits.valueBase)
         return newpyunits
@@ -392,68 +631,77 @@ class pyunits:
     # --- Comparison magic, less than
     def __lt__(self, other):
         if not isinstance(other, pyunits):
-            return round(self.value, precLevel) < round(other, precLevel)
+            return _roundPrec(self.value) < _roundPrec(other)
 
         # Ensure variables are the same SIID
         pyunits.checkSameSIIDCompare(self, other)
 
         # If no errors, then conduct comparison
-        return round(self.valueBase, precLevel) < round(other.valueBase, precLevel)
+        return _roundPrec(self.valueBase) < _roundPrec(other.valueBase)
 
     # --- Comparison magic, greater than
     def __gt__(self, other):
         if not isinstance(other, pyunits):
-            return round(self.value, precLevel) > round(other, precLevel)
+            return _roundPrec(self.value) > _roundPrec(other)
 
         # Ensure variables are the same SIID
         pyunits.checkSameSIIDCompare(self, other)
 
         # If no errors, then conduct comparison
-        return round(self.valueBase, precLevel) > round(other.valueBase, precLevel)
+        return _roundPrec(self.valueBase) > _roundPrec(other.valueBase)
 
     # --- Comparison magic, less than or equal
     def __le__(self, other):
         if not isinstance(other, pyunits):
-            return round(self.value, precLevel) <= round(other, precLevel)
+            return _roundPrec(self.value) <= _roundPrec(other)
 
         # Ensure variables are the same SIID
         pyunits.checkSameSIIDCompare(self, other)
 
         # If no errors, then conduct comparison
-        return round(self.valueBase, precLevel) <= round(other.valueBase, precLevel)
+        return _roundPrec(self.valueBase) <= _roundPrec(other.valueBase)
 
     # --- Comparison magic, greater than or equal
-    def __le__(self, other):
+    def __ge__(self, other):
         if not isinstance(other, pyunits):
-            return round(self.value, precLevel) >= round(other, precLevel)
+            return _roundPrec(self.value) >= _roundPrec(other)
 
         # Ensure variables are the same SIID
         pyunits.checkSameSIIDCompare(self, other)
 
         # If no errors, then conduct comparison
-        return round(self.valueBase, precLevel) >= round(other.valueBase, precLevel)
+        return _roundPrec(self.valueBase) >= _roundPrec(other.valueBase)
 
     # --- Comparison magic, equal to
-    def __le__(self, other):
+    def __eq__(self, other):
         if not isinstance(other, pyunits):
-            return round(self.value, precLevel) == round(other, precLevel)
+            # Let Python handle non-numeric values
+            if not isinstance(other, numbers.Real):
+                return NotImplemented
+            return _roundPrec(self.value) == _roundPrec(other)
 
-        # Ensure variables are the same SIID
-        pyunits.checkSameSIIDCompare(self, other)
+        # Variables from different unitSets are never equal
+        if not _sameSIID(self, other):
+            return False
 
-        # If no errors, then conduct comparison
-        return round(self.valueBase, precLevel) == round(other.valueBase, precLevel)
+        return _roundPrec(self.valueBase) == _roundPrec(other.valueBase)
 
     # --- Comparison magic, not equal to
-    def __le__(self, other):
+    def __ne__(self, other):
         if not isinstance(other, pyunits):
-            return round(self.value, precLevel) != round(other, precLevel)
+            # Let Python handle non-numeric values
+            if not isinstance(other, numbers.Real):
+                return NotImplemented
+            return _roundPrec(self.value) != _roundPrec(other)
 
-        # Ensure variables are the same SIID
-        pyunits.checkSameSIIDCompare(self, other)
+        # Variables from different unitSets are never equal
+        if not _sameSIID(self, other):
+            return True
 
-        # If no errors, then conduct comparison
-        return round(self.valueBase, precLevel) != round(other.valueBase, precLevel)
+        return _roundPrec(self.valueBase) != _roundPrec(other.valueBase)
+
+    # Instances are mutable and compare by value, hence are unhashable
+    __hash__ = None
 
     # Float magic, return float number
     def __float__(self):
@@ -483,23 +731,17 @@ class pyunits:
 
     # Unit converter function, which returns value of transformed unit
     def convert(self, toUnit, out="variable"):
-        # Check that toUnit exists within the unitSet
-        try:
-            toUnitIndex = unitDict[self.unitSet][0].index(toUnit)
-        except ValueError:
-            raise Exception("unit to convert to does not exist within the unitSet.")
-
-        # Check also that fromUnit is still within the unitSet
+        # Check that fromUnit is still within a unitSet
         try:
-            fromUnitIndex = unitDict[self.unitSet][0].index(self.unit)
-        except ValueError:
+            fromFactors = _FACTOR[self.unit]
+        except KeyError:
             raise Exception("unit to convert from does not exist within the unitSet.")
 
-        # Evaluate the conversion factor
-        conversionFactor = (
-            unitDict[self.unitSet][1][toUnitIndex]
-            / unitDict[self.unitSet][1][fromUnitIndex]
-        )
+        # Retrieve the conversion factor, checking that toUnit exists within the same unitSet
+        try:
+            conversionFactor = fromFactors[toUnit]
+        except KeyError:
+            raise Exception("unit to convert to does not exist within the unitSet.")
 
         # Determine desired output type (value or variable.)
         if out == "value":
@@ -511,14 +753,63 @@ class pyunits:
         else:
             raise Exception("unknown output specified in convert() method")
 
+    # Batch unit converter, for values held in a numpy array (or any object supporting scalar multiplication)
+    @classmethod
+    def convertArray(cls, values, fromUnit, toUnit):
+        # Retrieve the conversion factor once, then convert all values in a single vectorised multiplication
+        try:
+            fromFactors = _FACTOR[fromUnit]
+        except KeyError:
+            raise Exception("unit to convert from does not exist within the unitSet.")
+        try:
+            conversionFactor = fromFactors[toUnit]
+        except KeyError:
+            raise Exception("unit to convert to does not exist within the unitSet.")
+
+        return values * conversionFactor
+
+    # Bulk arithmetic on arrays of values ("add", "mul" or "pow"), with factors converting each operand to base units.
+    # Returns a float64 numpy array; the exponent of "pow" is dimensionless, hence takes no factor.
+    @classmethod
+    def jittedOp(cls, op, aValues, bValues, aFactor=1, bFactor=1):
+        import numpy  # Only required for bulk arithmetic
+
+        if op not in _BASE_UFUNCS:
+            raise Exception("unknown operation specified in jittedOp() method")
+        if op == "pow" and bFactor != 1:
+            raise Exception(
+                "exponent of pow is dimensionless, bFactor cannot be applied."
+            )
+
+        # Convert both operands to base units, as float64 arrays of the same shape
+        a, b = numpy.broadcast_arrays(
+            numpy.asarray(aValues, dtype=numpy.float64) * aFactor,
+            numpy.asarray(bValues, dtype=numpy.float64) * bFactor,
+        )
+        out = numpy.empty(a.shape)
+
+        # Without numba, fall back to numpy's vectorised operations
+        kernels = _baseKernels()
+        if not kernels:
+            getattr(numpy, _BASE_UFUNCS[op])(a, b, out=out)
+            return out
+
+        # Kernels operate on flat, contiguous arrays
+        kernels[op](
+            numpy.ascontiguousarray(a).ravel(),
+            numpy.ascontiguousarray(b).ravel(),
+            out.reshape(-1),
+        )
+        return out
+
     # Print function, to receive full variable details
     def stringVar(self):
         return "{} = {}{}, unitSet: {}, valueBase: {}, unitBase: {}, info: {}, formula: {}, SIID: {}".format(
             self.name,
-            self.value,
+            _roundPrec(self.value),
             self.unit,
             self.unitSet,
-            self.valueBase,
+            _roundPrec(self.valueBase),
             self.unitBase,
             self.info,
             self.formula,
@@ -526,53 +817,26 @@ class pyunits:
         )
 
     # UnitSetList generator function
-    def findUnitSet(unit):  # unit can be string name or SIID list
+    def findUnitSet(unit):  # unit can be string name or SIID tuple
         # Evaluate the unitSet. All unit names and SIIDs in unitDict are unique, hence can retrieve either 1 or 0 values
         if isinstance(unit, str):
-            return [
-                unitSet
-                for unitSet, unitLists in unitDict.items()
-                if unit in unitLists[0]
-            ]  # unitLists[0] contains the units as a list of strings
-        elif isinstance(unit, list):
-            return [
-                unitSet
-                for unitSet, unitLists in unitDict.items()
-                if unit == unitLists[3]
-            ]  # unitLists[3] contains the SSID as a list
+            return [_UNIT_TO_SET[unit]] if unit in _UNIT_TO_SET else []
+        elif isinstance(unit, (tuple, list)):
+            unit = _packSIID(tuple(unit))  # SIIDs are looked up in packed form
+            return [_SIID_TO_SET[unit]] if unit in _SIID_TO_SET else []
         else:
             raise Exception(
-                "findUnitSet retrieved input which was neither a string (unit name) nor a list (SIID list)."
+                "findUnitSet retrieved input which was neither a string (unit name) nor a tuple (SIID tuple)."
             )
 
     # Establish the unit based on the SIID for non-unitSet numbers.
     def findUnitFromSIID(SIID):
-        tmpUnit = ""  # string for the actual units
-        lstSIUnits = [
-            "m",
-            "kg",
-            "s",
-            "K",
-            "A",
-            "mole",
-            "cd",
-        ]  # list of SI units, in the order of the SIID list
-
-        # Generate the unit format
-        for unit, power in zip(lstSIUnits, SIID):
-            if power != 0:  # If not dimensionless
-                if power == 1:  # Simply add the unit (without power)
-                    tmpUnit += ("{} ").format(unit)
-                else:  # Add the unit with the power
-                    tmpUnit += ("{}{} ").format(unit, power)
-            else:
-                continue  # When unit is dimensionless
-        tmpUnit = tmpUnit[:-1]  # Removes last " " space
-
-        return tmpUnit
+        # Integer-valued powers are normalised, so that cached results do not depend on int/float types.
+        # Internal callers normalise SIIDs where they are created, and use _unitFromSIID directly.
+        return _unitFromSIID(_intSIID(SIID))
 
     def checkSameSIIDCompare(firstVar, secondVar):
-        if firstVar.SIID != secondVar.SIID:
+        if not _sameSIID(firstVar, secondVar):
             raise Exception(
                 "cannot compare values from different unitSets. Unit sets in question: {} and {} | SIID: {} and {}.".format(
                     firstVar.unitSet, secondVar.unitSet, firstVar.SIID, secondVar.SIID
@@ -584,13 +848,18 @@ def unitDicTest():
     # Test that each unitSet contains unique units, and that units are not repeated accross unitSets
     lstUnits = []
     for key in unitDict.keys():
-        lstUnits.extend(unitDict[key][0])
+        lstUnits.extend(unitDict[key].units)
 
     if len(set(lstUnits)) != len(lstUnits):
         raise Exception(
             "duplicate units exist either within a unitSet or accross unitsets."
         )
 
+    # Test that the SIIDs of all unitSets are unique (as packed, which is how they are looked up)
+    lstSIIDs = [_packSIID(unitSet.siid) for unitSet in unitDict.values()]
+    if None in lstSIIDs or len(set(lstSIIDs)) != len(lstSIIDs):
+        raise Exception("duplicate or unpackable SIIDs exist accross unitsets.")
+
 
 # To run code as script
 def main():
@@ -614,6 +883,8 @@ def main():
     # print('{} = {}{}, unitSet: {}, valueBase: {}, unitBase: {}'.format(test.name, test.value, test.unit, test.unitSet, test.valueBase, test.unitBase))
 
 
+# Validate unitDict on import, the O(1) look-up tables rely on units and SIIDs being unique
+unitDicTest()
+
 if __name__ == "__main__":
-    unitDicTest()
     main()